@@ -26,13 +26,15 @@ def connect(*args, **kwargs):
     if fine_tune:
         pragmas.update(FINE_TUNED_PRAGMAS)
 
-    if pragmas:
-        for key, value in pragmas.items():
-            conn.execute(f"PRAGMA {key} = {value}")
+    # batch pragmas and extension loading in a single executescript() call
+    # rather than one round-trip per statement
+    script = "".join(f"PRAGMA {key} = {value};\n" for key, value in pragmas.items())
 
     if extensions:
         conn.enable_load_extension(True)
-        for ext in extensions:
-            conn.execute(f"SELECT load_extension('{ext}')")
+        script += "".join(f"SELECT load_extension('{ext}');\n" for ext in extensions)
+
+    if script:
+        conn.executescript(script)
 
     return conn
@@ -1,6 +1,8 @@
 from importlib import import_module
 from contextlib import contextmanager
-import threading
+import collections
+import contextvars
+import functools
 import logging
 import inspect
 import urllib.parse
@@ -78,8 +80,10 @@ class Engine:
         self.connection_factory = connection_factory
         self.logger = logging.getLogger("sqlorm") if logger is True else logger
         self.logger_level = logger_level
-        self.pool = [] if pool else False
-        self.active_conns = []
+        # a deque pops in O(1) and LIFO reuse hands back the hottest connection,
+        # the set makes the membership checks on disconnect O(1)
+        self.pool = collections.deque() if pool else False
+        self.active_conns = set()
         self.max_pool_conns = max_pool_conns
 
     def connect(self, from_pool=True):
@@ -87,23 +91,23 @@ class Engine:
             return self._connect()
 
         if self.pool:
-            conn = self.pool.pop(0)
+            conn = self.pool.pop()
             if self.logger:
                 getattr(self.logger, self.logger_level)("Re-using connection from pool")
-            self.pool_checkout.send(self, conn=conn)
+            _send_signal(self.pool_checkout, self, conn=conn)
         elif not self.max_pool_conns or len(self.active_conns) < self.max_pool_conns:
             conn = self._connect()
         else:
             raise EngineError("Max number of connections reached")
 
-        self.active_conns.append(conn)
+        self.active_conns.add(conn)
         return conn
     
     def _connect(self):
         if self.logger:
             getattr(self.logger, self.logger_level)("Creating new connection")
         conn = self.connection_factory(self.dbapi)
-        self.connected.send(self, conn=conn)
+        _send_signal(self.connected, self, conn=conn)
         return conn
 
     def disconnect(self, conn, force=False):
@@ -114,7 +118,7 @@ class Engine:
             if self.logger:
                 getattr(self.logger, self.logger_level)("Returning connection to pool")
             self.pool.append(conn)
-            self.pool_checkin.send(self, conn=conn)
+            _send_signal(self.pool_checkin, self, conn=conn)
         else:
             raise EngineError("Cannot close connection which is not part of pool")
         
@@ -122,18 +126,18 @@ class Engine:
         if self.logger:
             getattr(self.logger, self.logger_level)("Closing connection")
         conn.close()
-        self.disconnected.send(self, conn=conn)
+        _send_signal(self.disconnected, self, conn=conn)
 
     def disconnect_all(self):
         if self.pool is False:
             return
         if self.logger:
             getattr(self.logger, self.logger_level)("Closing all connections from pool")
-        for conn in self.pool + self.active_conns:
+        for conn in [*self.pool, *self.active_conns]:
             conn.close()
-            self.disconnected.send(self, conn=conn)
-        self.pool = []
-        self.active_conns = []
+            _send_signal(self.disconnected, self, conn=conn)
+        self.pool = collections.deque()
+        self.active_conns = set()
 
     def make_session(self, **kwargs):
         kwargs["engine"] = self
@@ -169,27 +173,31 @@ class EngineError(Exception):
 
 
 class _SessionContext:
-    """A per-thread stack of Session to keep track of the current session"""
+    """A per-context stack of Session to keep track of the current session
+    Backed by a ContextVar holding an immutable tuple: push/pop always set a
+    fresh value, so tasks that copied the context never mutate their parent's
+    stack and sessions are isolated per thread as well as per asyncio task,
+    while reading the current session stays a single lock-free get
+    """
 
     def __init__(self):
-        self.locals = threading.local()
+        self.var = contextvars.ContextVar("sqlorm_session_stack", default=())
 
     @property
     def stack(self):
-        if not hasattr(self.locals, "stack"):
-            self.locals.stack = []
-        return self.locals.stack
+        return self.var.get()
 
     @property
     def top(self):
-        if self.stack:
-            return self.stack[-1]
+        stack = self.var.get()
+        if stack:
+            return stack[-1]
 
     def push(self, session):
-        self.stack.append(session)
+        self.var.set(self.var.get() + (session,))
 
     def pop(self):
-        self.stack.pop()
+        self.var.set(self.var.get()[:-1])
 
     @contextmanager
     def __call__(self, session):
@@ -289,24 +297,24 @@ class Session:
             raise SessionEndedError()
         if not self.conn:
             return
-        if _signal_rv(self.before_commit.send(self)) is False:
+        if _send_signal(self.before_commit, self) is False:
             return
         if self.logger:
             getattr(self.logger, self.logger_level)("COMMIT")
         self.conn.commit()
-        self.after_commit.send(self)
+        _send_signal(self.after_commit, self)
 
     def rollback(self):
         if self.ended:
             raise SessionEndedError()
         if not self.conn:
             return
-        if _signal_rv(self.before_rollback.send(self)) is False:
+        if _send_signal(self.before_rollback, self) is False:
             return
         if self.logger:
             getattr(self.logger, self.logger_level)("ROLLBACK")
         self.conn.rollback()
-        self.after_rollback.send(self)
+        _send_signal(self.after_rollback, self)
 
     def close(self):
         if self.conn:
@@ -404,7 +412,7 @@ class Transaction:
             return self.session.connect().cursor()
         stmt, params = render(stmt, params)
 
-        rv = _signal_rv(self.before_execute.send(self, stmt=stmt, params=params, many=False))
+        rv = _send_signal(self.before_execute, self, stmt=stmt, params=params, many=False)
         if isinstance(rv, tuple):
             stmt, params = rv
         elif rv:
@@ -423,12 +431,12 @@ class Transaction:
             else:
                 cur.execute(stmt)
         except Exception as e:
-            rv = _signal_rv(self.handle_error.send(self, cursor=cur, stmt=stmt, params=params, exc=e, many=False))
+            rv = _send_signal(self.handle_error, self, cursor=cur, stmt=stmt, params=params, exc=e, many=False)
             if rv:
                 return rv
             raise
 
-        self.after_execute.send(self, cursor=cur, stmt=stmt, params=params, many=False)
+        _send_signal(self.after_execute, self, cursor=cur, stmt=stmt, params=params, many=False)
         return cur
 
     def execute(self, stmt, params=None):
@@ -439,9 +447,7 @@ class Transaction:
         self.cursor(stmt, params).close()
 
     def executemany(self, stmt, seq_of_parameters):
-        rv = _signal_rv(
-            self.before_execute.send(self, stmt=stmt, params=seq_of_parameters, many=True)
-        )
+        rv = _send_signal(self.before_execute, self, stmt=stmt, params=seq_of_parameters, many=True)
         if isinstance(rv, tuple):
             stmt, seq_of_parameters = rv
         elif rv is False:
@@ -457,12 +463,12 @@ class Transaction:
         try:
             cur.executemany(str(stmt), seq_of_parameters)
         except Exception as e:
-            if not _signal_rv(
-                self.handle_error.send(self, cursor=cur, stmt=stmt, params=seq_of_parameters, exc=e, many=True)
+            if not _send_signal(
+                self.handle_error, self, cursor=cur, stmt=stmt, params=seq_of_parameters, exc=e, many=True
             ):
                 raise
         
-        self.after_execute.send(self, cursor=cur, stmt=stmt, params=seq_of_parameters, many=True)
+        _send_signal(self.after_execute, self, cursor=cur, stmt=stmt, params=seq_of_parameters, many=True)
         cur.close()
 
     def fetch(self, stmt, params=None, model=None, obj=None, loader=None):
@@ -550,22 +556,43 @@ class TransactionEndedError(Exception):
 
 
 def parse_uri(uri):
+    """Parses a database URI into (module, connect_args, connect_kwargs)
+    Parsing is memoized per URI but fresh mutable containers are returned,
+    as Engine.from_uri updates the kwargs with its own overrides
+    """
+    module, args, kwargs = _parse_uri(uri)
+    return (
+        module,
+        list(args),
+        {k: dict(v) if isinstance(v, dict) else v for k, v in kwargs.items()},
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_uri(uri):
+    # the scheme is split manually as it is a module name whose case matters
     module, uri = uri.split("://", 1)
     kwargs = {}
     if "?" in uri:
         uri, qs = uri.split("?", 1)
-        for k, v in urllib.parse.parse_qs(qs).items():
-            for i in range(len(v)):
-                if v[i].isdecimal():
-                    v[i] = int(v[i])
-                elif v[i] in ("True", "False"):
-                    v[i] = True if v[i] == "True" else False
-            v = v if len(v) > 1 else v[0]
+        for k, v in urllib.parse.parse_qsl(qs):
+            if v.isdecimal():
+                v = int(v)
+            elif v in ("True", "False"):
+                v = v == "True"
             if "[" in k:
                 k, sub = k.rstrip("]").split("[")
-                kwargs.setdefault(k, {})[sub] = v
+                target = kwargs.setdefault(k, {})
+                k = sub
             else:
-                kwargs[k] = v
+                target = kwargs
+            if k in target:
+                if isinstance(target[k], list):
+                    target[k].append(v)
+                else:
+                    target[k] = [target[k], v]
+            else:
+                target[k] = v
     args = [uri] if uri else []
     return module, args, kwargs
 
@@ -578,3 +605,12 @@ def _signal_rv(signal_rv):
         if rv:
             final_rv = rv
     return final_rv
+
+
+def _send_signal(signal, sender, **kwargs):
+    """Sends the signal only when it has receivers and collapses the listener
+    return values like _signal_rv, so hot paths pay a single bool check when
+    nothing is connected
+    """
+    if signal.receivers:
+        return _signal_rv(signal.send(sender, **kwargs))
@@ -2,31 +2,53 @@ from .engine import Engine, Session, Transaction, ensure_session
 import functools
 
 
+def _engine_signal_filter(engine, func, sender, **kw):
+    if isinstance(sender, Engine):
+        matches = sender is engine
+    elif isinstance(sender, Session):
+        matches = sender.engine is engine
+    elif isinstance(sender, Transaction):
+        matches = sender.session.engine is engine
+    else:
+        matches = False
+    if matches:
+        return func(sender, **kw)
+
+
 def connect_via_engine(engine, signal, func=None):
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(sender, **kw):
-            matches = False
-            if isinstance(sender, Engine):
-                matches = sender is engine
-            elif isinstance(sender, Session):
-                matches = sender.engine is engine
-            elif isinstance(sender, Transaction):
-                matches = sender.session.engine is engine
-            if matches:
-                return func(sender, **kw)
+        # a partial of a module-level function is cheaper to dispatch than a
+        # closure and holds no cell references
+        wrapper = functools.partial(_engine_signal_filter, engine, func)
         signal.connect(wrapper, weak=False)
         return wrapper
     return decorator(func) if func else decorator
 
 
+class _AfterCommitListener:
+    """One-shot listener calling func when the session commits, discarded on rollback"""
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, session, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        Session.after_commit.connect(self.on_commit, session, weak=False)
+        Session.after_rollback.connect(self.on_rollback, session, weak=False)
+
+    def disconnect(self):
+        Session.after_commit.disconnect(self.on_commit)
+        Session.after_rollback.disconnect(self.on_rollback)
+
+    def on_commit(self, session):
+        self.func(*self.args, **self.kwargs)
+        self.disconnect()
+
+    def on_rollback(self, session):
+        self.disconnect()
+
+
 def after_commit(func, *args, **kwargs):
     with ensure_session() as session:
-        def rollback_listener(session):
-            Session.after_commit.disconnect(commit_listener)
-            Session.after_rollback.disconnect(rollback_listener)
-        def commit_listener(session):
-            func(*args, **kwargs)
-            rollback_listener(session)
-        Session.after_commit.connect(commit_listener, session, weak=False)
-        Session.after_rollback.connect(rollback_listener, session, weak=False)
\ No newline at end of file
+        _AfterCommitListener(session, func, args, kwargs)
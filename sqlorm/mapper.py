@@ -2,7 +2,10 @@ from .sql import SQL, Column as SQLColumn, ColumnExpr as SQLColumnExpr, ColumnLi
 from .sql_template import SQLTemplate
 from .resultset import CompositionMap, ResultSet
 from .types import SQLType
+import operator
+import sys
 import typing as t
+import weakref
 
 
 PrimaryKeyColumn = object()
@@ -21,14 +24,25 @@ class MapperError(Exception):
     pass
 
 
+_mapper_cache = weakref.WeakKeyDictionary()  # class -> Mapper, for classes without __mapper__
+
+
 class Mapper:
     """Maps database columns to object attributes"""
 
     @classmethod
     def from_class(cls, object_class, **kwargs):
-        """Creates a Mapper from a class annotations"""
+        """Creates a Mapper from a class annotations
+        Mappers built without custom options are cached per class, so wrapping
+        the same plain class repeatedly does not re-read its annotations
+        """
         if hasattr(object_class, "__mapper__"):
             return object_class.__mapper__
+        cacheable = not kwargs
+        if cacheable:
+            mapper = _mapper_cache.get(object_class)
+            if mapper is not None:
+                return mapper
         mapper = cls(
             object_class,
             kwargs.pop("table", getattr(object_class, "__table__", object_class.__name__)),
@@ -42,6 +56,8 @@ class Mapper:
             mapper.columns.append(
                 Column(key, SQLType.from_pytype(value), primary_key=primary_key, attribute=key)
             )
+        if cacheable:
+            _mapper_cache[object_class] = mapper
         return mapper
 
     def __init__(self, object_class, table, allow_unknown_columns=True, **mapped_attrs):
@@ -51,10 +67,19 @@ class Mapper:
         self.force_select_wildcard = False
         self.columns = MapperColumnList(self)
         self.relationships = []
+        self._select_cache = {}
+        self._dehydrate_cache = {}
+        self._hydration_plans = {}
+        self._create_table_cache = {}
         if mapped_attrs:
             self.map(mapped_attrs)
 
     def map(self, attr, col_or_rel=None):
+        # cached statements and column selections may reference outdated columns
+        self._select_cache.clear()
+        self._dehydrate_cache.clear()
+        self._hydration_plans.clear()
+        self._create_table_cache.clear()
         if isinstance(col_or_rel, MappedColumnMixin):
             col_or_rel.attribute = attr
             col_or_rel.mapper = self
@@ -114,22 +139,28 @@ class Mapper:
             return pk_cols[0]
 
     def primary_key_condition(self, pk, table_alias=None, prefix=None) -> SQL:
-        """Returns the SQL condition to query a single row from this mapped table matching the primary key"""
+        """Returns the SQL condition to query a single row from this mapped table matching the primary key
+        The left-hand side of the condition is fixed per alias/prefix, so it is
+        built once and only the bound value changes across calls
+        """
         if isinstance(pk, self.object_class):
             pk = self.get_primary_key(pk)
-        cols = self.primary_key
-        if isinstance(cols, list):
+        key = ("pk_cond", table_alias, prefix)
+        lhs = self._select_cache.get(key)
+        if lhs is None:
+            cols = self.primary_key
+            if not cols:
+                raise MapperError(f"Missing primary key for table {self.table}")
+            if isinstance(cols, list):
+                lhs = [col.aliased_table(table_alias).prefixed(prefix) for col in cols]
+            else:
+                lhs = cols.aliased_table(table_alias).prefixed(prefix)
+            self._select_cache[key] = lhs
+        if isinstance(lhs, list):
             if not isinstance(pk, (list, tuple)):
                 raise MapperError("Primary key is a composite and requires a tuple")
-            return SQL.And(
-                [
-                    col.aliased_table(table_alias).prefixed(prefix) == SQL.Param(pk[i])
-                    for i, col in enumerate(cols)
-                ]
-            )
-        if cols:
-            return cols.aliased_table(table_alias).prefixed(prefix) == SQL.Param(pk)
-        raise MapperError(f"Missing primary key for table {self.table}")
+            return SQL.And([SQL(col, "=", SQL.Param(pk[i])) for i, col in enumerate(lhs)])
+        return SQL(lhs, "=", SQL.Param(pk))
 
     def get_primary_key(self, obj):
         """Returns the primary key value of the model object"""
@@ -154,32 +185,131 @@ class Mapper:
         return defaults
 
     def hydrate_new(self, data):
-        """Initializes a new object, skipping __init__() and populates it using hydrate()"""
-        obj = self.object_class.__new__(self.object_class)  # prevents calling __init__()
-        self.hydrate(obj, data)
+        """Initializes a new object, skipping __init__(), and populates it
+        Values are written straight into the instance dict as a fresh object
+        cannot have dirty attributes or custom state to preserve
+        """
+        cls = self.object_class
+        obj = cls.__new__(cls)  # prevents calling __init__()
+        d = obj.__dict__
+        plan = self._hydration_plan(tuple(data.keys()))
+        for key, attr, loader in plan:
+            value = data[key]
+            d[attr] = loader(value) if loader else value
+        d["__hydrated_attrs__"] = {attr for _, attr, _ in plan}
         return obj
 
     def hydrate(self, obj, data, with_unknown=None):
         """Populates a model object with data from the db"""
         attrs = set()
-        for key in (
-            data.keys()
-        ):  # avoid using .items() as some DBAPI returned objects only provide keys() (eg: sqlite3)
-            if key in self.columns.names:
-                col = self.columns[key]
-                col.load(obj, data)
-                key = col.attribute
-            elif with_unknown or with_unknown is None and self.allow_unknown_columns:
-                obj.__dict__[key] = data[key]  # ensure that no custom setter are used
-            else:
-                continue
-            attrs.add(key)
-        if not hasattr(obj, "__hydrated_attrs__"):
-            object.__setattr__(obj, "__hydrated_attrs__", attrs)
+        d = obj.__dict__  # values are written straight into the instance dict
+        if with_unknown is None or with_unknown is self.allow_unknown_columns:
+            # the memoized plan already snapshots the column loaders, no
+            # per-value type lookup needed
+            for key, attr, loader in self._hydration_plan(tuple(data.keys())):
+                value = data[key]
+                d[attr] = loader(value) if loader else value
+                attrs.add(attr)
+        else:
+            by_name = self.columns._by_name
+            for key in (
+                data.keys()
+            ):  # avoid using .items() as some DBAPI returned objects only provide keys() (eg: sqlite3)
+                col = by_name.get(key)
+                if col is not None:
+                    col.load(obj, data)
+                    key = col.attribute
+                elif with_unknown:
+                    d[key] = data[key]
+                else:
+                    continue
+                attrs.add(key)
+        hydrated = obj.__dict__.get("__hydrated_attrs__")
+        if hydrated is None:
+            obj.__dict__["__hydrated_attrs__"] = attrs
         else:
-            object.__setattr__(obj, "__hydrated_attrs__", obj.__hydrated_attrs__ | attrs)
+            hydrated |= attrs  # update in place rather than reallocating the set
         return attrs
 
+    def _hydration_plan(self, keys, by_index=False):
+        """Returns the (key, attribute, loader) steps needed to hydrate a row shape
+        Plans are memoized per row shape, invalidated by map(). With by_index the
+        key is the column position, so sequence rows are indexed without the
+        per-name lookup dbapi row objects do on every access
+        """
+        # allow_unknown_columns can be toggled at runtime, it is part of the key
+        allow_unknown = self.allow_unknown_columns
+        cache_key = ("#", keys, allow_unknown) if by_index else (keys, allow_unknown)
+        plan = self._hydration_plans.get(cache_key)
+        if plan is not None:
+            return plan
+        plan = []
+        by_name = self.columns._by_name
+        for i, key in enumerate(keys):
+            if isinstance(key, str):
+                key = sys.intern(key)
+            col = by_name.get(key)
+            if col is not None:
+                plan.append(
+                    (i if by_index else key, col.attribute, col.type.loader if col.type else None)
+                )
+            elif allow_unknown:
+                plan.append((i if by_index else key, key, None))
+        self._hydration_plans[cache_key] = plan
+        return plan
+
+    def hydrate_many(self, rows, keys=None):
+        """Hydrates a new object per row in a single pass (used by HydratedResultSet.all())
+        The column to attribute resolution is done once per row shape rather than
+        per row and values are written straight into the instance dict. When the
+        column names are provided (from the cursor description), rows are indexed
+        by position instead of by name
+        """
+        cls = self.object_class
+        new = cls.__new__
+        if keys is not None:
+            plan = self._hydration_plan(tuple(keys), by_index=True)
+            attrs = {attr for _, attr, _ in plan}
+            # rows is a fully fetched list, so the result can be sized exactly
+            objs = [None] * len(rows)
+            if len(plan) > 1 and not any(loader for _, _, loader in plan):
+                # no value loader involved, extract and assign whole rows at
+                # C speed with itemgetter and zip
+                getter = operator.itemgetter(*(i for i, _, _ in plan))
+                plan_attrs = tuple(attr for _, attr, _ in plan)
+                for n, row in enumerate(rows):
+                    obj = new(cls)
+                    d = obj.__dict__
+                    d.update(zip(plan_attrs, getter(row)))
+                    d["__hydrated_attrs__"] = set(attrs)
+                    objs[n] = obj
+                return objs
+            for n, row in enumerate(rows):
+                obj = new(cls)
+                d = obj.__dict__
+                for i, attr, loader in plan:
+                    value = row[i]
+                    d[attr] = loader(value) if loader else value
+                d["__hydrated_attrs__"] = set(attrs)
+                objs[n] = obj
+            return objs
+        objs = []
+        plan_keys = plan = attrs = None
+        for row in rows:
+            keys = tuple(row.keys())
+            if keys != plan_keys:
+                plan_keys = keys
+                plan = self._hydration_plan(keys)
+                attrs = {attr for _, attr, _ in plan}
+            obj = cls.__new__(cls)
+            d = obj.__dict__
+            for key, attr, loader in plan:
+                value = row[key]
+                d[attr] = loader(value) if loader else value
+            d["__hydrated_attrs__"] = set(attrs)
+            objs.append(obj)
+        return objs
+
     def dehydrate(
         self,
         obj,
@@ -189,28 +319,57 @@ class Mapper:
         with_unknown=None,
         additional_attrs=None,
     ) -> t.Mapping[str, t.Any]:
-        """Returns the model object as data to be sent to the db"""
-        cols = [c for c in self.columns if with_primary_key or not c.primary_key]
+        """Returns the model object as data to be sent to the db
+        The mapped column selection is memoized per (with_primary_key, only,
+        except_) shape as real workloads only use a handful of combinations
+        """
+        if only is not None and not isinstance(only, frozenset):
+            only = frozenset(only)
+        if except_ is not None and not isinstance(except_, frozenset):
+            except_ = frozenset(except_)
+        shape = (with_primary_key, only, except_)
+        dumps = self._dehydrate_cache.get(shape)
+        if dumps is None:
+            # cache the bound dump methods so the per-call loop does no
+            # attribute lookup per column
+            dumps = self._dehydrate_cache[shape] = [
+                c.dump
+                for c in self.columns
+                if (with_primary_key or not c.primary_key)
+                and (only is None or c.attribute in only)
+                and (except_ is None or c.attribute not in except_)
+            ]
+
+        values = {}
+        for dump in dumps:
+            dump(obj, values)
         if with_unknown or with_unknown is None and self.allow_unknown_columns:
-            for attr in getattr(obj, "__hydrated_attrs__", []):
-                if attr not in self.attr_names:
-                    cols.append(Column(attr, attribute=attr))
+            hydrated = getattr(obj, "__hydrated_attrs__", None)
+            if hydrated:
+                attr_names = self.attr_names
+                for attr in hydrated:
+                    if (
+                        attr in attr_names
+                        or only is not None
+                        and attr not in only
+                        or except_ is not None
+                        and attr in except_
+                    ):
+                        continue
+                    Column(attr, attribute=attr).dump(obj, values)
         if additional_attrs:
             for attr in additional_attrs:
-                cols.append(
-                    Column(
-                        additional_attrs[attr] if isinstance(additional_attrs, dict) else attr,
-                        attribute=attr,
-                    )
-                )
-
-        values = {}
-        for col in cols:
-            if only is not None and col.attribute not in only:
-                continue
-            if except_ is not None and col.attribute in except_:
-                continue
-            col.dump(obj, values)
+                if (
+                    only is not None
+                    and attr not in only
+                    or except_ is not None
+                    and attr in except_
+                ):
+                    continue
+                Column(
+                    additional_attrs[attr] if isinstance(additional_attrs, dict) else attr,
+                    attribute=attr,
+                ).dump(obj, values)
         return values
 
     def select_columns(
@@ -235,7 +394,22 @@ class Mapper:
     def select_from(
         self, columns=None, table_alias=None, with_rels=None, with_joins=None, with_lazy=False
     ) -> SQL:
-        """Creates a SELECT statement based on the mapping information"""
+        """Creates a SELECT statement based on the mapping information
+        The mapping is immutable once declared, so statements built from the
+        common scalar arguments are memoized until map() is called again
+        """
+        cache_key = None
+        if (
+            columns is None
+            and isinstance(table_alias, (str, type(None)))
+            and isinstance(with_rels, (bool, str, type(None)))
+            and isinstance(with_joins, (bool, str, type(None)))
+            and isinstance(with_lazy, (bool, str))
+        ):
+            cache_key = (table_alias, with_rels, with_joins, with_lazy)
+            stmt = self._select_cache.get(cache_key)
+            if stmt is not None:
+                return stmt
         if columns is None:
             columns = self.select_columns(
                 with_lazy, table_alias or self.table, wildcard_if_empty=True
@@ -270,7 +444,10 @@ class Mapper:
                     and (rel.attribute in with_joins or rel in with_joins)
                 ):
                     joins.append(rel.join_clause())
-        return SQL.select(columns).from_(SQL.Id(self.table, table_alias), *joins)
+        stmt = SQL.select(columns).from_(SQL.Id(self.table, table_alias), *joins)
+        if cache_key is not None:
+            self._select_cache[cache_key] = stmt
+        return stmt
 
     def select_by_pk(self, pk, **select_kwargs):
         return self.select_from(**select_kwargs).where(
@@ -302,9 +479,9 @@ class MapperColumnList(ColumnList):
         self.mapper = mapper
 
     def get(self, name):
-        for col in self:
-            if col.name == name:
-                return col
+        col = self._by_name.get(name)
+        if col is not None:
+            return col
         if self.mapper.allow_unknown_columns:
             col = Column(name)
             col.attribute = name
@@ -315,6 +492,10 @@ class MapperColumnList(ColumnList):
 class MappedColumnMixin:
     """Reprensents a mapped column."""
 
+    # the mapping attributes are declared as slots on the concrete classes,
+    # a mixin cannot carry them without conflicting with the SQL base layout
+    __slots__ = ()
+
     attribute: str  # will be provided by Mapper when added to it
     mapper: Mapper  # will be provided by Mapper when added to it
 
@@ -330,7 +511,8 @@ class MappedColumnMixin:
         lazy=False,
         attribute=None,
     ):
-        self.name = name
+        # interned names make the dict lookups during hydration compare by identity
+        self.name = sys.intern(name) if isinstance(name, str) else name
         self.table = None
         self.alias = None
         self.prefix = None
@@ -341,7 +523,7 @@ class MappedColumnMixin:
         self.references = references
         self.unique = unique
         self.lazy = lazy
-        self.attribute = attribute
+        self.attribute = sys.intern(attribute) if isinstance(attribute, str) else attribute
 
     def get(self, obj):
         """Returns the database value from the object, using the provided dump function if needed
@@ -373,11 +555,26 @@ class MappedColumnMixin:
         return f"<{self.__class__.__name__}({self.name} -> {self.attribute})>"
 
 
+_MAPPED_COLUMN_SLOTS = (
+    "type",
+    "primary_key",
+    "nullable",
+    "default",
+    "references",
+    "unique",
+    "lazy",
+    "attribute",
+    "mapper",
+)
+
+
 class Column(MappedColumnMixin, SQLColumn):
-    pass
+    __slots__ = _MAPPED_COLUMN_SLOTS
 
 
 class ColumnExpr(MappedColumnMixin, SQLColumnExpr):
+    __slots__ = _MAPPED_COLUMN_SLOTS
+
     def __init__(self, expr, alias, *args, **kwargs):
         MappedColumnMixin.__init__(self, alias, *args, **kwargs)
         self.expr = expr
@@ -413,6 +610,7 @@ class Relationship:
         self.select_cols = select_cols
         self.single = single
         self.lazy = lazy
+        self._join_clause_cache = {}
 
     @property
     def target_mapper(self) -> Mapper:
@@ -480,12 +678,18 @@ class Relationship:
         )
 
     def join_clause(self, target_alias=None, source_alias=None):
-        return SQL(
-            self.join_type,
-            SQL.Id(self.target_table, target_alias),
-            "ON",
-            self.join_condition(target_alias, source_alias),
-        )
+        # the relationship wiring is immutable once mapped, so the clause is
+        # built once per alias pair (select_from calls this on every query)
+        key = (target_alias, source_alias)
+        clause = self._join_clause_cache.get(key)
+        if clause is None:
+            clause = self._join_clause_cache[key] = SQL(
+                self.join_type,
+                SQL.Id(self.target_table, target_alias),
+                "ON",
+                self.join_condition(target_alias, source_alias),
+            )
+        return clause
 
     def select_from_target(self, source_obj):
         """Returns the select statement used to retrieve objects from the target"""
@@ -530,6 +734,21 @@ class HydratedResultSet(ResultSet):
         super().__init__(cursor, mapper.hydrate_new, auto_close_cursor)
         self.mapper = mapper
 
+    def all(self):
+        if not self.cursor:
+            return []
+        # fetch all rows in a single driver call and hydrate them in one pass,
+        # indexing rows by position using the cursor description
+        rows = self.cursor.fetchall()
+        description = self.cursor.description
+        if self.auto_close_cursor:
+            self.cursor.close()
+        keys = tuple(d[0] for d in description) if description else None
+        objs = self.mapper.hydrate_many(rows, keys)
+        for obj in objs:
+            self._tag_batch(obj)
+        return objs
+
 
 class HydrationMap(CompositionMap):
     def __init__(self, mapper, nested=None, single=False):
@@ -1,10 +1,9 @@
 import abc
 import typing as t
-import inspect
 from .sql import SQL, Column as SQLColumn, ColumnExpr as SQLColumnExpr
-from .engine import Engine, ensure_transaction, _signals, _signal_rv
-from .sqlfunc import is_sqlfunc, sqlfunc, fetchall, fetchone, execute, update
-from .resultset import ResultSet, CompositeResultSet
+from .engine import Engine, ensure_transaction, _signals, _send_signal
+from .sqlfunc import is_sqlfunc, sqlfunc, fetchall, fetchone, execute, update, _getdoc
+from .resultset import ResultSet, CompositeResultSet, result_batches
 from .types import SQLType, Integer
 from .mapper import (
     Mapper,
@@ -78,7 +77,7 @@ class ModelMetaclass(abc.ABCMeta):
 
     @staticmethod
     def make_sqlfunc_from_method(func, decorator, template_locals=None):
-        doc = inspect.getdoc(func)
+        doc = _getdoc(func)  # cache hit, is_sqlfunc() already inspected it
         accessor = "cls" if decorator is classmethod else "self"
         if doc.upper().startswith("SELECT WHERE"):
             doc = doc[7:]
@@ -149,10 +148,37 @@ class ModelMetaclass(abc.ABCMeta):
 class ModelMapper(Mapper):
     """Subclass of Mapper to handle dirtyness tracking"""
 
+    _pk_select_parts = None
+
+    def map(self, attr, col_or_rel=None):
+        self._pk_select_parts = None  # the cached statement may reference outdated columns
+        super().map(attr, col_or_rel)
+
+    def select_by_pk_cached(self, pk) -> SQL:
+        """Same as select_by_pk(pk).limit(1) but reuses a precomputed statement skeleton
+        so repeated primary key lookups don't rebuild the same SQL parts every time
+        """
+        parts = self._pk_select_parts
+        if parts is None:
+            pk_col = self.primary_key
+            if not pk_col or isinstance(pk_col, list):
+                # no caching for composite primary keys, they are not the hot path
+                return self.select_from(with_rels=False).where(
+                    self.primary_key_condition(pk, self.table)
+                ).limit(1)
+            parts = self._pk_select_parts = (
+                *self.select_from(with_rels=False).parts,
+                "WHERE",
+                pk_col.aliased_table(self.table),
+                "=",
+            )
+        return SQL(*parts, SQL.Param(pk), "LIMIT 1")
+
     def hydrate(self, obj, data, with_unknown=None):
         attrs = super().hydrate(obj, data, with_unknown=with_unknown)
-        if hasattr(obj, "__dirty__"):
-            object.__setattr__(obj, "__dirty__", obj.__dirty__ - attrs)
+        dirty = obj.__dict__.get("__dirty__")
+        if dirty:
+            dirty.difference_update(attrs)
         return attrs
 
     def dehydrate(
@@ -160,7 +186,10 @@ class ModelMapper(Mapper):
     ) -> t.Mapping[str, t.Any]:
         only = None
         if dirty_only or dirty_only is None and obj.Meta.insert_update_dirty_only:
-            only = getattr(obj, "__dirty__", set())
+            only = getattr(obj, "__dirty__", None)
+            if not only:
+                # pristine object, the column scan cannot yield anything
+                return {}
             if with_unknown or with_unknown is None and self.allow_unknown_columns:
                 additional_attrs = [a for a in only if a not in self.attr_names]
 
@@ -264,9 +293,45 @@ class Relationship(MappedRelationship):
 
     def fetch(self, obj):
         """Fetches the list of related objects from the database and loads it in the object"""
+        if not self.single and self._fetch_batched(obj):
+            return
         r = self.target.query(self.select_from_target(obj))
         self.__set__(obj, r.first() if self.single else r.all())
 
+    def _fetch_batched(self, obj):
+        """Loads this relationship for all unloaded siblings of the result set
+        obj was hydrated from, using a single IN query instead of one query per
+        object (the N+1 pattern when iterating results and accessing the same
+        relationship on each of them)
+        """
+        batch = result_batches.get(obj)
+        if batch is None or self._join_condition or not self.target_col:
+            return False
+        source_attr = self.source_attr
+        parents = {}
+        for ref in batch:
+            sibling = ref()
+            if sibling is not None and not self.is_loaded(sibling):
+                value = getattr(sibling, source_attr, None)
+                if value is not None:
+                    parents.setdefault(value, []).append(sibling)
+        if len(parents) < 2 or getattr(obj, source_attr, None) not in parents:
+            return False
+        stmt = self.target_mapper.select_from().where(
+            SQL.Col(self.target_col).in_(SQL.Tuple([SQL.Param(value) for value in parents]))
+        )
+        items = self.target.query(stmt).all()
+        buckets = {value: [] for value in parents}
+        target_attr = self.target_attr
+        for item in items:
+            bucket = buckets.get(getattr(item, target_attr, None))
+            if bucket is not None:
+                bucket.append(item)
+        for value, siblings in parents.items():
+            for sibling in siblings:
+                self.__set__(sibling, list(buckets[value]))
+        return True
+
 
 class RelatedObjectsList(object):
     def __init__(self, obj, relationship, items):
@@ -304,9 +369,13 @@ class RelatedObjectsList(object):
 
 
 def flag_dirty_attr(obj, attr):
-    if not hasattr(obj, "__dirty__"):
-        object.__setattr__(obj, "__dirty__", set())
-    obj.__dirty__.add(attr)
+    # __dirty__ only ever lives in the instance dict, so go straight to it
+    # rather than paying a hasattr/getattr on every attribute write
+    d = obj.__dict__
+    dirty = d.get("__dirty__")
+    if dirty is None:
+        dirty = d["__dirty__"] = set()
+    dirty.add(attr)
 
 
 def is_dirty(obj) -> bool:
@@ -314,13 +383,21 @@ def is_dirty(obj) -> bool:
 
 
 class ModelRegistry(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._by_table = None
+
     def register(self, model):
         self[model.__name__] = model
+        self._by_table = None  # lazily rebuilt on the next getbytable()
 
     def getbytable(self, table):
-        for model in self.values():
-            if model.__mapper__.table == table:
-                return model
+        by_table = self._by_table
+        if by_table is None:
+            by_table = self._by_table = {}
+            for model in self.values():
+                by_table.setdefault(str(model.__mapper__.table), model)
+        return by_table.get(str(table))
 
 
 class BaseModel(abc.ABC, metaclass=ModelMetaclass):
@@ -381,7 +458,7 @@ class Model(BaseModel, abc.ABC):
     def query(cls, stmt, params=None) -> CompositeResultSet:
         """Executes a query and returns results where rows are hydrated to model objects"""
         with ensure_transaction(cls.__engine__) as tx:
-            rv = _signal_rv(cls.before_query.send(cls, stmt=stmt, params=params))
+            rv = _send_signal(cls.before_query, cls, stmt=stmt, params=params)
             if rv is False:
                 return ResultSet(None)
             if isinstance(rv, ResultSet):
@@ -399,14 +476,13 @@ class Model(BaseModel, abc.ABC):
         with_lazy=False,
         **cols,
     ) -> CompositeResultSet:
-        where = SQL.And([])
+        table = cls.table.name
+        conditions = [SQL.Col(col, table) == SQL.Param(value) for col, value in cols.items()]
         if _where:
-            where.append(_where)
-        for col, value in cols.items():
-            where.append(SQL.Col(col, cls.table.name) == SQL.Param(value))
+            conditions.insert(0, _where)
         stmt = cls.select_from(with_rels=with_rels, with_joins=with_joins, with_lazy=with_lazy)
-        if where:
-            stmt = stmt.where(where)
+        if conditions:
+            stmt = stmt.where(SQL.And(conditions))
         return cls.query(stmt)
 
     @classmethod
@@ -418,18 +494,19 @@ class Model(BaseModel, abc.ABC):
         with_lazy=False,
         **cols,
     ):
-        where = SQL.And([])
+        table = cls.table.name
+        conditions = [SQL.Col(col, table) == SQL.Param(value) for col, value in cols.items()]
         if _where:
-            where.append(_where)
-        for col, value in cols.items():
-            where.append(SQL.Col(col, cls.table.name) == SQL.Param(value))
+            conditions.insert(0, _where)
         stmt = cls.select_from(with_rels=with_rels, with_joins=with_joins, with_lazy=with_lazy)
-        if where:
-            stmt = stmt.where(where)
+        if conditions:
+            stmt = stmt.where(SQL.And(conditions))
         return cls.query(stmt.limit(1)).first()
 
     @classmethod
     def get(cls, pk, with_rels=False, with_lazy=False):
+        if not with_rels and not with_lazy:
+            return cls.query(cls.__mapper__.select_by_pk_cached(pk)).first()
         return cls.query(
             cls.select_from(with_rels=with_rels, with_lazy=with_lazy)
             .where(cls.__mapper__.primary_key_condition(pk, cls.table.name))
@@ -452,31 +529,40 @@ class Model(BaseModel, abc.ABC):
 
     def refresh(self, **select_kwargs):
         stmt = self.__mapper__.select_by_pk(self.__mapper__.get_primary_key(self), **select_kwargs)
-        rv = _signal_rv(self.before_refresh.send(self.__class__, obj=self))
+        rv = _send_signal(self.before_refresh, self.__class__, obj=self)
         if rv is False:
             return False
         if rv:
             stmt = rv
         with ensure_transaction(self.__engine__) as tx:
             tx.fetchhydrated(self, stmt)
-        self.after_refresh.send(self.__class__, obj=self)
+        _send_signal(self.after_refresh, self.__class__, obj=self)
         return True
 
     def insert(self, **dehydrate_kwargs):
         stmt = self.__mapper__.insert(self, **dehydrate_kwargs).returning("*")
-        rv = _signal_rv(self.before_insert.send(self.__class__, obj=self))
+        rv = _send_signal(self.before_insert, self.__class__, obj=self)
         if rv is False:
             return False
         if rv:
             stmt = rv
         with ensure_transaction(self.__engine__) as tx:
             tx.fetchhydrated(self, stmt)
-        self.after_insert.send(self.__class__, obj=self)
+        _send_signal(self.after_insert, self.__class__, obj=self)
         return True
 
     def update(self, **dehydrate_kwargs):
-        stmt = self.__mapper__.update(self, **dehydrate_kwargs)
-        rv = _signal_rv(self.before_update.send(self.__class__, obj=self))
+        if (
+            not dehydrate_kwargs
+            and self.Meta.insert_update_dirty_only
+            and not is_dirty(self)
+        ):
+            # pristine object, skip dehydrating entirely (a before_update
+            # listener can still provide a statement below)
+            stmt = None
+        else:
+            stmt = self.__mapper__.update(self, **dehydrate_kwargs)
+        rv = _send_signal(self.before_update, self.__class__, obj=self)
         if rv is False:
             return False
         if rv:
@@ -484,32 +570,71 @@ class Model(BaseModel, abc.ABC):
         if stmt:
             with ensure_transaction(self.__engine__) as tx:
                 tx.fetchhydrated(self, stmt.returning("*"))
-            self.after_update.send(self.__class__, obj=self)
+            _send_signal(self.after_update, self.__class__, obj=self)
             return True
         return False
 
     def save(self, **dehydrate_kwargs):
         is_new = not bool(self.__mapper__.get_primary_key(self))
-        if _signal_rv(self.before_save.send(self.__class__, obj=self, is_new=is_new)) is False:
+        if _send_signal(self.before_save, self.__class__, obj=self, is_new=is_new) is False:
             return False
         if is_new:
             done = self.insert(**dehydrate_kwargs)
         else:
             done = self.update(**dehydrate_kwargs)
         if done:
-            self.after_save.send(self.__class__, obj=self)
+            _send_signal(self.after_save, self.__class__, obj=self)
         return done
 
+    @classmethod
+    def save_many(cls, objs):
+        """Saves many objects at once, batching new objects into a single INSERT
+        per set of dehydrated columns using executemany
+        Existing objects and objects for which a listener provides a custom
+        statement are saved individually. Contrary to save(), batch inserted
+        objects do not get database generated values back (eg. auto-increment
+        primary keys)
+        """
+        groups = {}
+        with ensure_transaction(cls.__engine__) as tx:
+            for obj in objs:
+                is_new = not bool(obj.__mapper__.get_primary_key(obj))
+                if _send_signal(cls.before_save, cls, obj=obj, is_new=is_new) is False:
+                    continue
+                if not is_new:
+                    if obj.update():
+                        _send_signal(cls.after_save, cls, obj=obj)
+                    continue
+                rv = _send_signal(cls.before_insert, cls, obj=obj)
+                if rv is False:
+                    continue
+                if rv:
+                    tx.fetchhydrated(obj, rv)
+                    _send_signal(cls.after_insert, cls, obj=obj)
+                    _send_signal(cls.after_save, cls, obj=obj)
+                    continue
+                values = obj.__mapper__.dehydrate(obj)
+                groups.setdefault(tuple(values), []).append((obj, list(values.values())))
+            for columns, rows in groups.items():
+                stmt = SQL.insert(
+                    cls.table, {c: SQL.ParamPlaceholder(c) for c in columns}
+                )
+                tx.executemany(stmt, [row for _, row in rows])
+                for obj, _ in rows:
+                    obj.__dict__.pop("__dirty__", None)
+                    _send_signal(cls.after_insert, cls, obj=obj)
+                    _send_signal(cls.after_save, cls, obj=obj)
+
     def delete(self):
         stmt = self.__mapper__.delete(self)
-        rv = _signal_rv(self.before_delete.send(self.__class__, obj=self))
+        rv = _send_signal(self.before_delete, self.__class__, obj=self)
         if rv is False:
             return False
         if rv:
             stmt = rv
         with ensure_transaction(self.__engine__) as tx:
             tx.execute(stmt)
-        self.after_delete.send(self.__class__, obj=self)
+        _send_signal(self.after_delete, self.__class__, obj=self)
         return True
 
     def __repr__(self):
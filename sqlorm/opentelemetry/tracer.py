@@ -1,5 +1,7 @@
 # Modified from opentelemetry-instrumentation-sqlalchemy
+import functools
 import re
+import types
 
 from opentelemetry import trace
 from opentelemetry.instrumentation.sqlcommenter_utils import _add_sql_comment
@@ -10,6 +12,7 @@ from opentelemetry.trace.status import Status, StatusCode
 from ..engine import Engine, Transaction, connect_via_engine
 
 
+@functools.lru_cache(maxsize=16)
 def _normalize_vendor(vendor):
     """Return a canonical name for a type of database."""
     if not vendor:
@@ -57,6 +60,9 @@ def _wrap_connect(tracer):
 
 class EngineTracer:
     _remove_event_listener_params = []
+    # shared immutable attribute dicts, the values never change per event
+    _IDLE_ATTRS = types.MappingProxyType({"state": "idle"})
+    _USED_ATTRS = types.MappingProxyType({"state": "used"})
 
     def __init__(
         self,
@@ -72,6 +78,14 @@ class EngineTracer:
         self.enable_commenter = enable_commenter
         self.commenter_options = commenter_options if commenter_options else {}
         self._leading_comment_remover = re.compile(r"^/\*.*?\*/")
+        # driver/framework centric information and the filter mask are invariant,
+        # only the opentelemetry values change per span
+        self._commenter_static = {
+            k: v
+            for k, v in {"db_driver": self.vendor, "db_framework": "sqlorm"}.items()
+            if self.commenter_options.get(k, True)
+        }
+        self._commenter_include_otel = self.commenter_options.get("opentelemetry_values", True)
 
         self._register_event_listener(engine, Engine.connected, self._pool_connect)
         self._register_event_listener(engine, Engine.pool_checkout, self._pool_checkout)
@@ -82,20 +96,10 @@ class EngineTracer:
         self._register_event_listener(engine, Transaction.handle_error, _handle_error)
 
     def _add_idle_to_connection_usage(self, value):
-        self.connections_usage.add(
-            value,
-            attributes={
-                "state": "idle",
-            },
-        )
+        self.connections_usage.add(value, attributes=self._IDLE_ATTRS)
 
     def _add_used_to_connection_usage(self, value):
-        self.connections_usage.add(
-            value,
-            attributes={
-                "state": "used",
-            },
-        )
+        self.connections_usage.add(value, attributes=self._USED_ATTRS)
 
     def _pool_connect(self, engine, conn):
         self._add_idle_to_connection_usage(1)
@@ -131,9 +135,9 @@ class EngineTracer:
             # For some very special cases it might not record the correct statement if the SQL
             # dialect is too weird but in any case it shouldn't break anything.
             # Strip leading comments so we get the operation name.
-            parts.append(
-                self._leading_comment_remover.sub("", statement).split()[0]
-            )
+            if statement.startswith("/*"):
+                statement = self._leading_comment_remover.sub("", statement)
+            parts.append(statement.split(None, 1)[0])
         if db_name:
             parts.append(db_name)
         if not parts:
@@ -143,7 +147,6 @@ class EngineTracer:
     def _before_execute(
         self, tx, stmt, params, many
     ):
-        attrs = {}
         span = self.tracer.start_span(
             self._operation_name(None, stmt),
             kind=trace.SpanKind.CLIENT,
@@ -152,24 +155,16 @@ class EngineTracer:
             if span.is_recording():
                 span.set_attribute(SpanAttributes.DB_STATEMENT, stmt)
                 span.set_attribute(SpanAttributes.DB_SYSTEM, self.vendor)
-                for key, value in attrs.items():
-                    span.set_attribute(key, value)
             if self.enable_commenter:
-                commenter_data = {
-                    "db_driver": self.vendor,
-                    # Driver/framework centric information.
-                    "db_framework": "sqlorm",
-                }
-
-                if self.commenter_options.get("opentelemetry_values", True):
-                    commenter_data.update(**_get_opentelemetry_values())
-
-                # Filter down to just the requested attributes.
-                commenter_data = {
-                    k: v
-                    for k, v in commenter_data.items()
-                    if self.commenter_options.get(k, True)
-                }
+                commenter_data = dict(self._commenter_static)
+                if self._commenter_include_otel:
+                    # filter down to just the requested attributes
+                    get_option = self.commenter_options.get
+                    commenter_data.update(
+                        (k, v)
+                        for k, v in _get_opentelemetry_values().items()
+                        if get_option(k, True)
+                    )
 
                 stmt = _add_sql_comment(stmt, **commenter_data)
 
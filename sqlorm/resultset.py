@@ -1,3 +1,11 @@
+import weakref
+
+
+# obj -> list of weakrefs to the objects loaded from the same result set; kept
+# out of instance dicts so tagged objects stay picklable
+result_batches = weakref.WeakKeyDictionary()
+
+
 class ResultSet:
     """Wraps a cursor and fetches row that can be processed with a loader"""
 
@@ -5,6 +13,7 @@ class ResultSet:
         self.cursor = cursor
         self.loader = loader
         self.auto_close_cursor = auto_close_cursor
+        self._batch = []
 
     def close(self):
         if self.cursor:
@@ -20,9 +29,23 @@ class ResultSet:
                 self.cursor.close()
             return
         if with_loader and self.loader:
-            return self.loader(row)
+            obj = self.loader(row)
+            self._tag_batch(obj)
+            return obj
         return row
 
+    def _tag_batch(self, obj):
+        """Weakly links the objects loaded from this result set together, so
+        consumers (e.g. model relationships) can batch load data for the whole
+        set on first access
+        """
+        try:
+            ref = weakref.ref(obj)
+            result_batches[obj] = self._batch
+            self._batch.append(ref)
+        except TypeError:
+            pass  # object does not support weak references
+
     def first(self, with_loader=True):
         row = self.fetch(with_loader=with_loader)
         if self.auto_close_cursor:
@@ -132,25 +155,35 @@ class CompositeResultSet(ResultSet):
                     self.cursor.close()
                 self.cursor = None
                 if self.current:
-                    return self.current.compile(with_loader=with_loader)
+                    return self._compile(self.current, with_loader)
                 return
 
             if self.disable_composition:
                 # skip processing the row as no composition was detected previously
-                return self.map.loader(row) if with_loader and self.map.loader else row
+                if with_loader and self.map.loader:
+                    obj = self.map.loader(row)
+                    self._tag_batch(obj)
+                    return obj
+                return row
 
             row = CompositeRow(row, self.map, self.separator)
             if self.current is None:
                 if not row.is_composite:
                     # this is an optimization to reduce processing on further fetches
                     self.disable_composition = True
-                    return row.compile(with_loader=with_loader)
+                    return self._compile(row, with_loader)
                 self.current = row
             elif not self.current.merge(row):
-                current = self.current.compile(with_loader=with_loader)
+                current = self._compile(self.current, with_loader)
                 self.current = row
                 return current
 
+    def _compile(self, row, with_loader):
+        obj = row.compile(with_loader=with_loader)
+        if with_loader and self.map.loader:
+            self._tag_batch(obj)
+        return obj
+
     def all(self):
         # must go through our custom fetching logic
         return list(self.__iter__())
@@ -217,7 +250,7 @@ def split_composite_row(row, separator="__"):
         composite_key, composite_col = col.split(separator, 1)
         nested.setdefault(composite_key, {})[composite_col] = row.pop(col)
     for key in list(nested.keys()):
-        if all([nested[key][k] is None for k in nested[key]]):
+        if not any(v is not None for v in nested[key].values()):
             nested[key] = None
         else:
             nested[key] = split_composite_row(nested[key], separator)
@@ -20,49 +20,89 @@ def create_all(model_registry=None, engine=None, check_missing=False, logger=Non
     logger = logging.getLogger("sqlorm") if logger is True else logger
     if not model_registry:
         model_registry = BaseModel.__model_registry__
+    existing_tables = None
+    if check_missing:
+        with ensure_transaction(engine) as tx:
+            existing_tables = _list_tables(tx)
     for model in model_registry.values():
         missing = True
         if check_missing:
-            missing = False
-            with ensure_transaction(engine) as tx:
-                try:
-                    model.find_one()
-                except Exception:
-                    missing = True
+            if existing_tables is not None:
+                missing = str(model.__mapper__.table) not in existing_tables
+            else:
+                # no known catalog query for this dbapi, probe with a select
+                missing = False
+                with ensure_transaction(engine) as tx:
+                    try:
+                        model.find_one()
+                    except Exception:
+                        missing = True
         if missing:
             if logger:
                 logger.info(f"Creating table {model.__mapper__.table}")
             create_table(model.__mapper__, **kwargs)
 
 
+def _list_tables(tx):
+    """Returns the set of table names from the database catalog in a single query,
+    or None when the dbapi has no known catalog
+    """
+    engine = tx.session.engine
+    dbapi_name = getattr(engine.dbapi, "__name__", "") if engine else ""
+    if "sqlite" in dbapi_name:
+        stmt = "SELECT name FROM sqlite_master WHERE type = 'table'"
+    elif "postgres" in dbapi_name or "psycopg" in dbapi_name:
+        stmt = (
+            "SELECT tablename FROM pg_catalog.pg_tables"
+            " WHERE schemaname NOT IN ('pg_catalog', 'information_schema')"
+        )
+    elif "mysql" in dbapi_name:
+        stmt = "SHOW TABLES"
+    else:
+        return None
+    try:
+        return set(tx.fetchscalars(stmt))
+    except Exception:
+        return None
+
+
 @execute
 def create_table(mapper, default_type="varchar"):
     if not isinstance(mapper, Mapper):
         mapper = Mapper.from_class(mapper)
-    return SQL(
-        "CREATE TABLE",
-        mapper.table,
-        SQL.Tuple(
-            [
+    # cached on the mapper so it is invalidated by map() like the other
+    # per-mapper caches
+    stmt = mapper._create_table_cache.get(default_type)
+    if stmt is not None:
+        return stmt
+    columns = []
+    for c in mapper.columns:
+        sql_type = c.type.sql_type if c.type else default_type
+        if not c.unique and c.nullable and not c.primary_key and not c.references:
+            # most columns have no constraints, a flat string renders the same
+            columns.append(f"{c.name} {sql_type}")
+            continue
+        columns.append(
+            SQL(
+                c.name,
+                sql_type,
+                "UNIQUE" if c.unique else "",
+                "NOT NULL" if not c.nullable else "",
+                "PRIMARY KEY" if c.primary_key else "",
                 SQL(
-                    c.name,
-                    c.type.sql_type if c.type else default_type,
-                    "UNIQUE" if c.unique else "",
-                    "NOT NULL" if not c.nullable else "",
-                    "PRIMARY KEY" if c.primary_key else "",
-                    SQL(
-                        "REFERENCES",
-                        f"{c.references.table} ({c.references.name})"
-                        if isinstance(c.references, SQL.Col)
-                        else c.references,
-                    )
-                    if c.references
-                    else "",
+                    "REFERENCES",
+                    f"{c.references.table} ({c.references.name})"
+                    if isinstance(c.references, SQL.Col)
+                    else c.references,
                 )
-                for c in mapper.columns
-            ]
-        ),
+                if c.references
+                else "",
+            )
+        )
+    stmt = mapper._create_table_cache[default_type] = SQL(
+        "CREATE TABLE", mapper.table, SQL.Tuple(columns)
     )
+    return stmt
 
 
 def migrate(
@@ -100,19 +140,34 @@ def migrate(
         return version
 
 
+_migration_filename_re = re.compile(r"([0-9]+)_([^.]+)\.(sql|py)", re.I)
+
+# directory path -> (dir mtime_ns, [(version, name, filepath)]); discovery only
+# depends on filenames, so the scan can be skipped until the directory changes
+_migrations_dir_cache = {}
+
+
 def create_migrations_from_dir(path, from_version=None, to_version=None):
+    mtime = os.stat(path).st_mtime_ns
+    cached = _migrations_dir_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        all_migrations = cached[1]
+    else:
+        all_migrations = []
+        with os.scandir(path) as entries:
+            filenames = sorted((e.name, e.path) for e in entries)
+        for filename, filepath in filenames:
+            m = _migration_filename_re.match(filename)
+            if m:
+                all_migrations.append((int(m.group(1)), m.group(2), filepath))
+        _migrations_dir_cache[path] = (mtime, all_migrations)
     migrations = []
-    for filename in sorted(os.listdir(path)):
-        m = re.match(r"([0-9]+)_([^.]+)\.(sql|py)", filename, re.I)
-        if not m:
-            continue
-        version = int(m.group(1))
-        name = m.group(2)
+    for version, name, filepath in all_migrations:
         if from_version is not None and version <= int(from_version):
             continue
         if to_version is not None and version > int(to_version):
             break
-        migrations.append((version, name, os.path.join(path, filename)))
+        migrations.append((version, name, filepath))
     return migrations
 
 
@@ -120,10 +175,18 @@ def execute_migration(filename, engine=None):
     if filename.endswith(".py"):
         runpy.run_path(filename)
     else:
-        with open(filename) as f:
-            statements = split_sql_statements(f.read())
+        with open(filename, "rb") as f:
+            script = f.read()
         with ensure_transaction(engine) as tx:
-            tx.execute(statements)
+            conn = tx.session.connect()
+            if hasattr(conn, "executescript") and not getattr(conn, "in_transaction", True):
+                # sqlite3 can run the whole script in a single driver call
+                # (only when no writes are pending, as executescript commits first)
+                conn.executescript(script.decode("utf-8"))
+            else:
+                # scan the raw bytes and only decode the resulting statements
+                statements = [stmt.decode("utf-8") for stmt in split_sql_statements(script)]
+                tx.execute(statements)
 
 
 def get_schema_version(engine=None):
@@ -134,14 +197,19 @@ def get_schema_version(engine=None):
             pass
 
 
+# built once, the version is passed as a bind parameter at execution time
+_update_schema_version_sql = SQL.update(
+    "schema_version", {"version": SQL.ParamPlaceholder("version")}
+)
+_insert_schema_version_sql = SQL.insert(
+    "schema_version", {"version": SQL.ParamPlaceholder("version")}
+)
+
+
 def set_schema_version(version, engine=None):
     with ensure_transaction(engine) as tx:
         try:
-            tx.execute(SQL.update("schema_version", {"version": version}))
+            tx.execute(_update_schema_version_sql, [version])
         except Exception:
-            tx.execute(
-                (
-                    "CREATE TABLE schema_version (version text)",
-                    SQL.insert("schema_version", {"version": version}),
-                )
-            )
+            tx.execute("CREATE TABLE schema_version (version text)")
+            tx.execute(_insert_schema_version_sql, [version])
@@ -1,9 +1,15 @@
+import functools
+import re
+import sys
 import typing as t
 from collections import namedtuple
 
 
 def render(stmt, params=None, dbapi=None, paramstyle=None):
     """Renders the provided sql statement and returns a tuple (sql, params)"""
+    if isinstance(stmt, str):
+        # nothing to collect, skip the collector machinery entirely
+        return stmt, params
     if not dbapi and not paramstyle and isinstance(params, dict):
         paramstyle = "pyformat"
     elif not paramstyle and dbapi:
@@ -12,7 +18,10 @@ def render(stmt, params=None, dbapi=None, paramstyle=None):
         paramstyle = "qmark"
 
     if isinstance(stmt, SQLStr):
-        collector = ParameterCollector(params, paramstyle)
+        if paramstyle in ("qmark", "format") and not isinstance(params, dict):
+            collector = _FastCollector(params, paramstyle)
+        else:
+            collector = ParameterCollector(params, paramstyle)
         stmt = stmt._render(collector)
         params = collector.values
     elif hasattr(stmt, "__sql__"):
@@ -35,15 +44,30 @@ class ParametrizedStmt(namedtuple("_ParametrizedStmt", ["stmt", "params"])):
 class SQLStr:
     """The base for our SQL pieces"""
 
+    __slots__ = ()
+
+    # class tag checked with getattr() in hot paths, where it is cheaper than
+    # isinstance() for the common plain str/int/None values
+    _is_sqlstr = True
+
     def render(self):
         """Renders this piece of sql and returns a tuple (sql_stmt, params)"""
-        collector = ParameterCollector()
+        collector = _FastCollector()
         stmt = self._render(collector)
         return str(stmt), collector.values
 
     def _render(self, params):
         raise NotImplementedError()
 
+    def _render_into(self, out, params):
+        """Appends the rendered tokens of this piece of sql to the out list
+        Composite pieces override this to share a single token list so nested
+        statements are joined only once at the top level
+        """
+        stmt = self._render(params)
+        if stmt:
+            out.append(stmt if isinstance(stmt, str) else str(stmt))
+
     def __sql__(self):
         return self.render()
 
@@ -51,7 +75,7 @@ class SQLStr:
         return self.render()[0]
 
     def op(self, operator, other):
-        if not isinstance(other, SQLStr):
+        if not getattr(other, "_is_sqlstr", False):
             other = SQL.Param(other)
         return SQL(self, operator, other)
 
@@ -98,28 +122,48 @@ class SQLStr:
         return self.op("ILIKE", other)
 
 
+_KW_CACHE: t.Dict[str, str] = {}  # attribute name -> uppercased SQL keyword
+
+
 class SQL(SQLStr):
     """Represents a composable piece of SQL"""
 
+    __slots__ = ("parts",)
+
     def __init__(self, *parts):
         self.parts = list(parts)
 
+    @classmethod
+    def _from_parts(cls, parts):
+        """Builds an SQL object adopting the parts list without copying it"""
+        self = cls.__new__(cls)
+        self.parts = parts
+        return self
+
     def _render(self, params):
-        stmt = []
+        out = []
+        self._render_into(out, params)
+        return " ".join(out)
+
+    def _render_into(self, out, params):
+        append = out.append
         for part in self.parts:
-            if isinstance(part, SQLStr):
-                stmt.append(str(part._render(params)))
+            if getattr(part, "_is_sqlstr", False):
+                part._render_into(out, params)
             elif part:
-                stmt.append(str(part))
-        return " ".join(filter(bool, stmt))
+                append(part if isinstance(part, str) else str(part))
 
     def __getattr__(self, name):
         """Allows you to do some query builder semantics
         Example: SQL().select("*").from_("table").where("condition").limit(1)
         """
-        return lambda *p: SQL(
-            *list(self.parts + [name.replace("_", " ").upper().strip()] + list(p))
-        )
+        if name.startswith("__") and name.endswith("__"):
+            # don't hijack special method lookups (eg. copy protocol)
+            raise AttributeError(name)
+        kw = _KW_CACHE.get(name)
+        if kw is None:
+            kw = _KW_CACHE[name] = sys.intern(name.replace("_", " ").upper().strip())
+        return lambda *p: SQL._from_parts([*self.parts, kw, *p])
 
     @staticmethod
     def select(*args):
@@ -136,7 +180,7 @@ class SQL(SQLStr):
         if isinstance(values, (str, SQLStr)):
             return SQL("INSERT INTO", table, values)
         values_sql = Tuple(
-            [v if isinstance(v, SQLStr) else Parameter(v, c) for c, v in values.items()]
+            [v if getattr(v, "_is_sqlstr", False) else Parameter(v, c) for c, v in values.items()]
         )
         return SQL("INSERT INTO", table, Tuple(values.keys()), "VALUES", values_sql)
 
@@ -146,7 +190,7 @@ class SQL(SQLStr):
             return SQL("UPDATE", table)
         values_sql = List(
             [
-                SQL(c, "=", v if isinstance(v, SQLStr) else Parameter(v, c))
+                SQL(c, "=", v if getattr(v, "_is_sqlstr", False) else Parameter(v, c))
                 for c, v in values.items()
             ]
         )
@@ -169,6 +213,8 @@ class SQL(SQLStr):
 class Parameter(SQLStr):
     """A statement parameter contains a value that won't be outputted in the SQL statement"""
 
+    __slots__ = ("value", "name")
+
     def __init__(self, value, name=None):
         self.value = value
         self.name = name
@@ -182,6 +228,8 @@ class Parameter(SQLStr):
 
 
 class ParameterPlaceholder(Parameter):
+    __slots__ = ()
+
     def __init__(self, name):
         self.name = name
 
@@ -189,8 +237,30 @@ class ParameterPlaceholder(Parameter):
         return format_param(self.name, params.paramstyle)
 
 
+_identifier_intern: t.Dict[tuple, "Identifier"] = {}  # statements re-use few distinct identifiers
+
+
 class Identifier(SQLStr):
-    """An SQL identifier that can be aliased"""
+    """An SQL identifier that can be aliased
+    Instances of the base classes are interned per constructor arguments so
+    repeated identifiers share a single object (subclasses are not interned
+    as they carry extra mutable state)
+    """
+
+    __slots__ = ("name", "alias")
+
+    def __new__(cls, name=None, *args, **kwargs):
+        if cls is not Identifier or type(name) is not str:  # noqa: E721 (str subclasses must not share interned instances)
+            return super().__new__(cls)
+        try:
+            key = (Identifier, name, args, tuple(sorted(kwargs.items())))
+            self = _identifier_intern.get(key)
+        except TypeError:
+            # unhashable argument (eg. an SQL fragment), skip interning
+            return super().__new__(cls)
+        if self is None:
+            self = _identifier_intern[key] = super().__new__(cls)
+        return self
 
     def __init__(self, name, alias=None):
         if isinstance(name, Identifier):
@@ -215,6 +285,21 @@ class Identifier(SQLStr):
 class Column(Identifier):
     """Represents a column with eventually the table identifier and an alias"""
 
+    __slots__ = ("table", "prefix")
+
+    def __new__(cls, name=None, *args, **kwargs):
+        if cls is not Column or type(name) is not str:  # noqa: E721 (str subclasses must not share interned instances)
+            return object.__new__(cls)
+        try:
+            key = (Column, name, args, tuple(sorted(kwargs.items())))
+            self = _identifier_intern.get(key)
+        except TypeError:
+            # unhashable argument (eg. an Identifier table), skip interning
+            return object.__new__(cls)
+        if self is None:
+            self = _identifier_intern[key] = object.__new__(cls)
+        return self
+
     def __init__(self, name, table=None, prefix=None, alias=None):
         if isinstance(name, Column):
             table = table or name.table
@@ -261,6 +346,8 @@ class Column(Identifier):
 class ColumnExpr(Column):
     """A virtual column that is an expression"""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr, alias, table=None, prefix=None):
         super().__init__(alias, table=table, prefix=prefix)
         self.expr = expr
@@ -285,6 +372,9 @@ class ColumnExpr(Column):
         return ColumnExpr(self.expr, self.name, self.table, prefix)
 
 
+_STAR_CACHE: t.Dict[str, str] = {}  # table name -> "table.*"
+
+
 class ColumnList(SQLStr, list):
     """A list of Column object with some easy accessors and utility methods
     When converted to str, will print a comma separated list of the columns
@@ -294,6 +384,8 @@ class ColumnList(SQLStr, list):
 
     def __init__(self, columns, table=None, prefix=None, wildcard=None):
         super().__init__()
+        self._by_name = {}
+        self._rendered = None
         self.table = table
         self.prefix = prefix
         self.wildcard = wildcard
@@ -307,12 +399,32 @@ class ColumnList(SQLStr, list):
                 col = self.column_class(col)
             self.append(col)
 
+    def append(self, col):
+        list.append(self, col)
+        self._rendered = None
+        if isinstance(col, Column):
+            self._by_name.setdefault(col.name, col)
+
     def _render(self, params):
         if self.wildcard or self.wildcard is None and not self:
-            return Column("*", self.table)._render(params)
+            table = self.table
+            if not table:
+                return "*"
+            if isinstance(table, str):
+                star = _STAR_CACHE.get(table)
+                if star is None:
+                    star = _STAR_CACHE[table] = f"{table}.*"
+                return star
+            return f"{table}.*"
         if not self:
             return ""
-        return List(self)._render(params)
+        rendered = self._rendered
+        if rendered is None:
+            rendered = List(self)._render(params)
+            if not any(isinstance(col, ColumnExpr) for col in self):
+                # plain columns render param-free, the joined string can be re-used
+                self._rendered = rendered
+        return rendered
 
     def aliased_table(self, alias):
         return ColumnList(self, alias, self.prefix, self.wildcard)
@@ -321,9 +433,7 @@ class ColumnList(SQLStr, list):
         return ColumnList(self, self.table, prefix, self.wildcard)
 
     def get(self, name):
-        for col in self:
-            if col.name == name:
-                return col
+        return self._by_name.get(name)
 
     def __getitem__(self, name):
         if isinstance(name, str):
@@ -337,7 +447,13 @@ class ColumnList(SQLStr, list):
         return bool(self.get(name))
 
     def __getattr__(self, name):
-        return self[name]
+        if name.startswith("_"):
+            # don't let internal or dunder lookups go through column resolution
+            raise AttributeError(name)
+        col = self.get(name)
+        if col is None:
+            raise AttributeError(name)
+        return col
 
     @property
     def names(self):
@@ -350,6 +466,8 @@ class ColumnList(SQLStr, list):
 class List(SQLStr, list):
     """A list of SQL items"""
 
+    __slots__ = ("joinstr", "startstr", "endstr")
+
     def __init__(self, items=None, joinstr=",", startstr="", endstr=""):
         super().__init__(items)
         self.joinstr = joinstr
@@ -357,34 +475,64 @@ class List(SQLStr, list):
         self.endstr = endstr
 
     def _render(self, params):
-        out = SQL()
+        out = []
+        self._render_into(out, params)
+        return " ".join(out)
+
+    def _render_into(self, out, params):
+        append = out.append
         if self.startstr:
-            out.parts.append(self.startstr)
+            append(self.startstr)
+        last = len(self) - 1
+        joinstr = self.joinstr
         for i, part in enumerate(self):
-            out.parts.append(part)
-            if i + 1 < len(self):
-                out.parts.append(self.joinstr)
+            if getattr(part, "_is_sqlstr", False):
+                part._render_into(out, params)
+            elif part:
+                append(part if isinstance(part, str) else str(part))
+            if i < last and joinstr:
+                append(joinstr)
         if self.endstr:
-            out.parts.append(self.endstr)
-        return out._render(params)
+            append(self.endstr)
+
+
+def _flatten_same(items, cls):
+    """Inlines nested groups of the same operator, which render the same with a
+    shallower tree (eg. And([And([a, b]), c]) is And([a, b, c]))
+    """
+    flat = []
+    for item in items:
+        if type(item) is cls:
+            flat.extend(item)
+        else:
+            flat.append(item)
+    return flat
 
 
 class And(List):
+    __slots__ = ()
+
     def __init__(self, items):
-        super().__init__(items, "AND", "(", ")")
+        super().__init__(_flatten_same(items, type(self)), "AND", "(", ")")
 
 
 class Or(List):
+    __slots__ = ()
+
     def __init__(self, items):
-        super().__init__(items, "OR", "(", ")")
+        super().__init__(_flatten_same(items, type(self)), "OR", "(", ")")
 
 
 class Tuple(List):
+    __slots__ = ()
+
     def __init__(self, items):
         super().__init__(items, ",", "(", ")")
 
 
 class Function(SQLStr):
+    __slots__ = ("name", "args")
+
     def __init__(self, name, *args):
         self.name = name.upper()
         self.args = args
@@ -407,21 +555,36 @@ class FunctionFactory:
         return Function(name)
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_numeric_param(name):
+    return f":{name if name is not None else 0}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_named_param(name):
+    return f":{name if name is not None else 'param'}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_pyformat_param(name):
+    return f"%({name if name is not None else 'param'})s"
+
+
+# one formatter per DBAPI paramstyle, so callers holding a style dispatch
+# with a single dict lookup instead of comparing style strings per parameter
+_param_formatters = {
+    "qmark": lambda name: "?",
+    "format": lambda name: "%s",
+    "numeric": _format_numeric_param,
+    "named": _format_named_param,
+    "pyformat": _format_pyformat_param,
+}
+
+
 def format_param(name, paramstyle):
     """Format a parameter based on the DBAPI paramstyle"""
-    if paramstyle == "qmark":
-        return "?"
-    if paramstyle == "format":
-        return "%s"
-    if paramstyle == "numeric":
-        if name is None:
-            name = 0
-        return f":{name}"
-    if name is None:
-        name = "param"
-    if paramstyle == "named":
-        return f":{name}"
-    return f"%({name})s"
+    # unknown styles format as pyformat, as before the formatter table
+    return _param_formatters.get(paramstyle, _format_pyformat_param)(name)
 
 
 class ParameterCollectorError(Exception):
@@ -441,15 +604,19 @@ class ParameterCollector:
 
     def __init__(self, params=None, paramstyle="qmark"):
         self.paramstyle = paramstyle
-        self.names = []
+        self._format = _param_formatters.get(paramstyle, _format_pyformat_param)
+        names = []
+        # anonymous parameters of positional styles get their param_N name
+        # generated lazily, only if names are actually asked for
+        self._pending_anon = 0
         if paramstyle in ("qmark", "numeric", "format"):
             self.values = []
             if isinstance(params, dict):
-                self.names.extend(params.keys())
+                names.extend(params.keys())
                 self.values.extend(params.values())
             elif params:
                 self.values.extend(params)
-                self.names.extend([f"param_{i+1}" for i in range(len(params))])
+                self._pending_anon = len(self.values)
         else:
             self.values = {}
             if params and not isinstance(params, dict):
@@ -457,27 +624,61 @@ class ParameterCollector:
                     "paramstyle is named, a dict must be provided as params"
                 )
             elif params:
-                self.names.extend(params.keys())
+                names.extend(params.keys())
                 self.values.update(params)
+        self._names_list = names
+        self._names = set(names)
+        self._counts = {}  # base name -> last used suffix, to allocate names in O(1)
+
+    @property
+    def names(self):
+        if self._pending_anon:
+            self._materialize_names()
+        return self._names_list
+
+    def _materialize_names(self):
+        """Generates the deferred param_N names of anonymous positional parameters"""
+        names = self._names_list
+        i = self._counts.get("param", 0)
+        for _ in range(self._pending_anon):
+            i += 1
+            name = f"param_{i}"
+            while name in self._names:
+                i += 1
+                name = f"param_{i}"
+            names.append(name)
+            self._names.add(name)
+        self._counts["param"] = i
+        self._pending_anon = 0
 
     def add(self, value, name: t.Optional[str] = None):
         """Add a parameter (possibly named) and returns its correctly formatted
         placeholder to add in the SQL statement
         """
-        if not name or name in self.names:
-            if not name:
-                name = "param"
-            i = 1
-            while f"{name}_{i}" in self.names:
+        values = self.values
+        if not name and isinstance(values, list):
+            # hot path: no name bookkeeping needed until names are requested
+            values.append(value)
+            self._pending_anon += 1
+            return self._format(len(values))
+        if self._pending_anon:
+            self._materialize_names()
+        if not name or name in self._names:
+            base = name if name else "param"
+            i = self._counts.get(base, 0) + 1
+            name = f"{base}_{i}"
+            while name in self._names:
                 i += 1
-            name = f"{name}_{i}"
-        self.names.append(name)
-        if isinstance(self.values, dict):
-            self.values[name] = value
+                name = f"{base}_{i}"
+            self._counts[base] = i
+        self._names.add(name)
+        self._names_list.append(name)
+        if isinstance(values, dict):
+            values[name] = value
         else:
-            self.values.append(value)
-            name = len(self.values)
-        return format_param(name, self.paramstyle)
+            values.append(value)
+            name = len(values)
+        return self._format(name)
 
     def get(self, name):
         """Returns the value of the named parameter"""
@@ -497,26 +698,88 @@ class ParameterCollector:
         return self.get(name)
 
 
+class _FastCollector:
+    """A minimal parameter collector for positional paramstyles with a static
+    placeholder, where names and uniqueness checks are not needed
+    """
+
+    __slots__ = ("values", "paramstyle", "placeholder")
+
+    def __init__(self, params=None, paramstyle="qmark"):
+        self.values = list(params) if params else []
+        self.paramstyle = paramstyle
+        self.placeholder = "?" if paramstyle == "qmark" else "%s"
+
+    def add(self, value, name: t.Optional[str] = None):
+        self.values.append(value)
+        return self.placeholder
+
+
+# a statement is any run of string literals (which may contain semi-colons and
+# run to the end of input when unterminated) and non-delimiter characters
+_split_stmt_re = re.compile(r"(?:'[^']*(?:'|\Z)|[^;'])+")
+_split_stmt_bytes_re = re.compile(_split_stmt_re.pattern.encode("ascii"))
+
+
 def split_sql_statements(sql):
+    """Splits a string containing multiple statements separated by semi-colons,
+    ignoring semi-colons in string literals
+    Also accepts undecoded bytes, in which case bytes statements are returned
+    (splitting on ascii delimiters never cuts a utf-8 sequence)
+    """
+    pattern = _split_stmt_re if isinstance(sql, str) else _split_stmt_bytes_re
     stmts = []
-    current = ""
-    in_str = False
-    for c in sql:
-        if c == "'":
-            in_str = not in_str
-        if c == ";" and not in_str:
-            current = current.strip()
-            if current:
-                stmts.append(current)
-            current = ""
-        else:
-            current += c
-    current = current.strip()
-    if current:
-        stmts.append(current)
+    for m in pattern.finditer(sql):
+        stmt = m.group(0).strip()
+        if stmt:
+            stmts.append(stmt)
     return stmts
 
 
+# generate real methods for the common builder keywords so chained calls use a
+# direct class-level lookup instead of going through __getattr__ and its string ops
+_BUILDER_METHOD_NAMES = (
+    "from_",
+    "where",
+    "and_",
+    "or_",
+    "not_",
+    "order_by",
+    "group_by",
+    "having",
+    "limit",
+    "offset",
+    "join",
+    "left_join",
+    "right_join",
+    "inner_join",
+    "outer_join",
+    "cross_join",
+    "on",
+    "using",
+    "values",
+    "returning",
+    "union",
+    "union_all",
+    "distinct",
+)
+
+
+def _make_builder_method(name):
+    kw = name.replace("_", " ").upper().strip()
+
+    def builder_method(self, *p):
+        return SQL._from_parts([*self.parts, kw, *p])
+
+    builder_method.__name__ = name
+    builder_method.__doc__ = f'Returns a new statement with "{kw}" and the given parts appended'
+    return builder_method
+
+
+for _name in _BUILDER_METHOD_NAMES:
+    setattr(SQL, _name, _make_builder_method(_name))
+
+
 SQL.List = List
 SQL.And = And
 SQL.Or = Or
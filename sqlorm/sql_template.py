@@ -1,4 +1,5 @@
 from .sql import SQL, SQLStr
+import copy
 import datetime
 import uuid
 
@@ -8,6 +9,9 @@ class EvalBlock(SQLStr):
 
     def __init__(self, template, code):
         self.template = template
+        if isinstance(code, str):
+            # strip like eval() on a raw string would, so "{ expr }" blocks compile
+            code = compile(code.strip(), "<sqltemplate>", "eval")
         self.code = code
 
     def eval(self):
@@ -26,6 +30,9 @@ class SQLTemplateError(Exception):
     pass
 
 
+_template_parts_cache = {}  # (class, raw source) -> parsed parts, templates are static strings
+
+
 class SQLTemplate(SQL):
     """Similar to f-strings but to generated parametrized statements
 
@@ -50,63 +57,72 @@ class SQLTemplate(SQL):
 
     def __init__(self, stmt, locals=None):
         self.locals = locals if locals is not None else {}
-        i = 0
-        eval_block = False
-        code = ""
-        sql = ""
+        parts = _template_parts_cache.get((self.__class__, stmt))
+        if parts is None:
+            parts = _template_parts_cache[(self.__class__, stmt)] = self._parse(stmt)
+        super().__init__(
+            *(
+                part.__class__(self, part.code) if isinstance(part, EvalBlock) else part
+                for part in parts
+            )
+        )
+
+    def _parse(self, stmt):
+        """Scans the template for eval blocks, compiling their code once
+        Parsing is memoized per source so re-instantiating the same template
+        with different locals skips the scan (the cached eval blocks are
+        unbound and rebound to each template instance)
+        """
         sql_parts = []
-        nestedc = 0
-
-        while True:
-            if i >= len(stmt):
+        i = 0
+        n = len(stmt)
+        while i < n:
+            # jump to the closest eval block start
+            j = -1
+            for s, e, cb in self.eval_blocks:
+                k = stmt.find(s, i)
+                if k != -1 and (j == -1 or k < j):
+                    j, start, end, eval_callback = k, s, e, cb
+            if j == -1:
                 break
-
-            is_eval = False
-            for start, end, eval_callback in self.eval_blocks:
-                if (
-                    (not eval_block or eval_block == start)
-                    and len(stmt) >= i + len(start) - 1
-                    and stmt[i : i + len(start)] == start
-                ):
-                    if eval_block:
-                        nestedc += 1
-                        code += start
-                    else:
-                        code = ""
-                        eval_block = start
-                        nestedc = 0
-                    i += len(start) - 1
-                    is_eval = True
-                elif (
-                    eval_block == start
-                    and len(stmt) >= i + len(end) - 1
-                    and stmt[i : i + len(end)] == end
-                ):
-                    if nestedc > 0:
-                        nestedc -= 1
-                        code += end
-                    else:
-                        sql_parts.append(sql.strip())
-                        sql_parts.append(eval_callback(self, code))
-                        sql = ""
-                        eval_block = False
-                    i += len(end) - 1
-                    is_eval = True
-                if is_eval:
-                    break
-
-            if not is_eval:
-                if eval_block:
-                    code += stmt[i]
+            sql = stmt[i:j].strip()
+            if sql:
+                sql_parts.append(sql)
+            # find the matching end token, accounting for nested start tokens
+            code_start = k = j + len(start)
+            nestedc = 0
+            while True:
+                close = stmt.find(end, k)
+                if close == -1:
+                    raise SQLTemplateError("Syntax error: eval block is not closed")
+                nested = stmt.find(start, k)
+                if nested != -1 and nested < close:
+                    nestedc += 1
+                    k = nested + len(start)
+                elif nestedc:
+                    nestedc -= 1
+                    k = close + len(end)
                 else:
-                    sql += stmt[i]
-            i += 1
-
-        if eval_block:
-            raise SQLTemplateError("Syntax error: eval block is not closed")
-        if sql:
-            sql_parts.append(sql.strip())
-        super().__init__(*sql_parts)
+                    break
+            sql_parts.append(eval_callback(None, stmt[code_start:close]))
+            i = close + len(end)
+        if i < n:
+            sql = stmt[i:].strip()
+            if sql:
+                sql_parts.append(sql)
+        return sql_parts
+
+    def bind(self, locals=None):
+        """Returns a shallow copy of this template bound to new locals,
+        so a parsed template can be reused without re-parsing the statement
+        """
+        tpl = copy.copy(self)
+        tpl.locals = locals if locals is not None else {}
+        tpl.parts = [
+            part.__class__(tpl, part.code) if isinstance(part, EvalBlock) else part
+            for part in self.parts
+        ]
+        return tpl
 
     def render(self, locals=None):
         _locals = self.locals
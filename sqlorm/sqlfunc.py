@@ -1,7 +1,7 @@
 import functools
 import inspect
 from .engine import ensure_transaction
-from .sql_template import SQLTemplate
+from .sql_template import EvalBlock, SQLTemplate
 
 
 def sqlfunc(func=None, template_locals=None, **kwargs):
@@ -9,25 +9,45 @@ def sqlfunc(func=None, template_locals=None, **kwargs):
 
     def decorator(func):
         doc = inspect.getdoc(func)
-        sig = inspect.signature(func)
+        template = SQLTemplate(doc)  # parse once, rebind the locals on each call
 
-        @functools.wraps(func)
-        def query_builder(*args, **kwargs):
-            return SQLTemplate(
-                doc, dict(func.template_locals, **sig.bind(*args, **kwargs).arguments)
+        if not any(isinstance(part, EvalBlock) for part in template.parts):
+            # constant statement with no eval blocks: render once at decoration
+            # time, render() passes plain strings through untouched
+            static_stmt = str(template)
+
+            @functools.wraps(func)
+            def query_builder(*args, **kwargs):
+                return static_stmt
+
+        else:
+            sig = inspect.signature(func)
+            param_names = tuple(sig.parameters)
+            fast_bind = not any(
+                p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in sig.parameters.values()
             )
 
+            @functools.wraps(func)
+            def query_builder(*args, **kwargs):
+                if fast_bind:
+                    # avoid the cost of sig.bind() when a zip is enough to match arguments
+                    arguments = dict(zip(param_names, args), **kwargs)
+                else:
+                    arguments = sig.bind(*args, **kwargs).arguments
+                return template.bind(dict(func.template_locals, **arguments))
+
+        upper_doc = doc.upper()
         if getattr(func, "query_decorator", False):
             # the function can already be decorated with a query decorator
             # in this case we replace the sql generation function of the query decorator
             func.sql = query_builder
             if "is_method" in kwargs:
                 func.is_method = kwargs["is_method"]
-        elif doc.upper().startswith("SELECT"):
+        elif upper_doc.startswith("SELECT"):
             func = fetchall(query_builder, **kwargs)
         elif (
-            doc.upper().startswith("UPDATE") or doc.upper().startswith("INSERT")
-        ) and "RETURNING" in doc.upper():
+            upper_doc.startswith("UPDATE") or upper_doc.startswith("INSERT")
+        ) and "RETURNING" in upper_doc:
             func = update(query_builder, **kwargs)
         else:
             func = execute(query_builder, **kwargs)
@@ -40,11 +60,33 @@ def sqlfunc(func=None, template_locals=None, **kwargs):
     return decorator
 
 
+@functools.cache
+def _getdoc(func):
+    """Cached inspect.getdoc() for the class-scanning phase, where the same function
+    is inspected multiple times (do not use once the docstring may have been rewritten)
+    """
+    return inspect.getdoc(func)
+
+
+def _empty_func():
+    "docstring"
+
+
+# the bytecode of a function whose body is only a docstring (it just returns None)
+_EMPTY_FUNC_CO_CODE = _empty_func.__code__.co_code
+
+
 def is_sqlfunc(func):
     """Checks if func is an empty function with a python doc"""
-    doc = inspect.getdoc(func)
-    src = inspect.getsource(func).strip(' "\n\r')
-    return doc and src.endswith(func.__doc__) and not getattr(func, "sqlfunc", False)
+    doc = _getdoc(func)
+    if not doc:
+        return False
+    code = getattr(func, "__code__", None)  # documented classes have no code
+    return (
+        code is not None
+        and code.co_code == _EMPTY_FUNC_CO_CODE
+        and not getattr(func, "sqlfunc", False)
+    )
 
 
 def _query_executor_builder(executor):
@@ -280,4 +280,11 @@ def test_mapper_create_from_class():
     assert mapper.columns[0] == mapper.primary_key
     assert mapper.columns[0].type.sql_type == "integer"
     assert mapper.columns[1].name == "title"
-    assert mapper.columns[1].type.sql_type == "text"
\ No newline at end of file
+    assert mapper.columns[1].type.sql_type == "text"
+
+    # only mappers built without custom options are cached
+    assert Mapper.from_class(Task) is mapper
+    custom = Mapper.from_class(Task, table="custom_table")
+    assert custom is not mapper
+    assert str(custom.table) == "custom_table"
+    assert str(Mapper.from_class(Task).table) == "Task"
\ No newline at end of file
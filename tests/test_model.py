@@ -2,6 +2,7 @@ from sqlorm import Model, SQL, Relationship, is_dirty, PrimaryKey, Column
 from sqlorm.mapper import Mapper
 from models import *
 import abc
+import pickle
 
 
 def test_model_registry():
@@ -88,6 +89,16 @@ def test_inheritance():
     assert B.col3.type.sql_type == "text"
 
 
+def test_documented_nested_class():
+    class C(Model):
+        col1: str
+
+        class Meta:
+            """a documented non-function attribute must not be treated as an sql method"""
+
+    assert C.__mapper__.columns.names == ["col1", "id"]
+
+
 def test_find_all(engine):
     listener_called = False
 
@@ -372,3 +383,43 @@ def test_delete(engine):
 
         user = User.get(4)
         assert not user
+
+
+def test_save_many(engine):
+    from sqlorm.engine import Transaction
+
+    executed = []
+
+    @Transaction.after_execute.connect
+    def on_after_execute(sender, **kwargs):
+        executed.append(kwargs["stmt"])
+
+    with engine:
+        User.save_many([User(email="many1@example.com"), User(email="many2@example.com")])
+        assert len(executed) == 1
+        assert User.find_one(email="many1@example.com")
+        assert User.find_one(email="many2@example.com")
+
+    Transaction.after_execute.disconnect(on_after_execute)
+
+
+def test_batched_relationship_loading(engine):
+    with engine:
+        u1 = User.create(email="batch1@example.com")
+        u2 = User.create(email="batch2@example.com")
+        Task.create(title="batch task 1", user_id=u1.id)
+        Task.create(title="batch task 2", user_id=u2.id)
+
+        users = User.find_all(SQL(f"users.id IN ({u1.id}, {u2.id})")).all()
+        assert len(users) == 2
+        assert not User.tasks.is_loaded(users[0])
+        assert not User.tasks.is_loaded(users[1])
+
+        # batch tagging must not make fetched objects unpicklable
+        assert pickle.loads(pickle.dumps(users[0])).email == u1.email
+
+        tasks = users[0].tasks
+        # accessing the relationship on one object loads it for the whole result set
+        assert User.tasks.is_loaded(users[1])
+        assert len(tasks) == 1
+        assert len(users[1].tasks) == 1
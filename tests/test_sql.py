@@ -101,6 +101,9 @@ def test_sql_column():
     assert str(SQL.Col(SQL.Col("col", "table"), prefix="prefix_")) == "table.col AS prefix_col"
     assert str(SQL.Col(SQL.Id("col"), prefix="prefix_")) == "col AS prefix_col"
 
+    # unhashable arguments are not interned but still work
+    assert str(SQL.Col("col", SQL.Id("table"))) == "table.col"
+
 
 def test_sql_column_list():
     cols = SQL.Cols(["col1", "col2", SQL.Col("col3")])
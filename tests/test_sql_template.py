@@ -8,6 +8,12 @@ def test_sql_template():
     assert params == ["bar"]
 
 
+def test_whitespace_in_eval_blocks():
+    stmt, params = SQLTemplate("SELECT * FROM { table } WHERE col1 = %( value )s", {"table": "foo", "value": "bar"}).render()
+    assert stmt == "SELECT * FROM foo WHERE col1 = ?"
+    assert params == ["bar"]
+
+
 def test_nested_brackets():
     assert str(SQLTemplate("{{'a': 'a'}['a']}")) == "a"
 
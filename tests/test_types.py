@@ -1,4 +1,5 @@
-from sqlorm.types import SQLType
+from sqlorm.types import SQLType, Encrypted
+import pytest
 
 
 def test_type():
@@ -15,5 +16,37 @@ def test_type():
 
     class T:
         __sqltype__ = "customtype"
-        
-    assert SQLType.from_pytype(T).sql_type == "customtype"
\ No newline at end of file
+
+    assert SQLType.from_pytype(T).sql_type == "customtype"
+
+
+def test_encrypted():
+    pytest.importorskip("Crypto")
+    t = Encrypted(b"0" * 32)
+    assert t.sql_type == "text"
+    encrypted = t.encrypt("hello")
+    assert encrypted != "hello"
+    assert t.encrypt("hello") != encrypted  # a fresh iv is used every time
+    assert t.decrypt(encrypted) == "hello"
+    assert t.encrypt(None) is None
+    assert t.decrypt(None) is None
+
+    t = Encrypted(lambda: b"0" * 32)
+    assert t.decrypt(t.encrypt("hello")) == "hello"
+
+    t = Encrypted(b"0" * 32, binary=True)
+    assert t.sql_type == "blob"
+    encrypted = t.encrypt("hello")
+    assert isinstance(encrypted, bytes)
+    assert t.decrypt(encrypted) == "hello"
+    assert t.decrypt_many([encrypted, None]) == ["hello", None]
+
+
+def test_encrypted_many():
+    pytest.importorskip("Crypto")
+    t = Encrypted(b"0" * 32)
+    values = ["hello", "world" * 10, None, ""]
+    encrypted = [t.encrypt(v) if v is not None else None for v in values]
+    assert t.decrypt_many(encrypted) == values
+    assert t.decrypt_many([None, None]) == [None, None]
+    assert t.decrypt_many([]) == []
\ No newline at end of file